@@ -9,11 +9,45 @@ import sys
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
 # Allow running from project root
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
 
 from src.extractors.usgs import USGSClient
 
+# On pandas 2.x, store the free-text "place" column as Arrow strings so
+# top_regions can hand it to the regex kernel without a conversion pass
+try:
+    pd.set_option("future.infer_string", True)
+except pd.errors.OptionError:
+    pass
+
+# "100 km S of Honshu, Japan" -> "Japan"
+REGION_PATTERN = r",\s*(?P<region>.+)$"
+
+
+def top_regions(places, n: int = 10) -> list:
+    """Return the ``n`` most common regions as (region, count) pairs.
+
+    Runs the region regex as a single RE2 kernel over an Arrow string
+    array instead of pandas' per-cell ``str.extract``.
+    """
+    arr = pa.array(places, type=pa.string(), from_pandas=True)
+    # struct_field keeps the struct's nulls (no match, null place);
+    # StructArray.field would turn them into empty strings
+    extracted = pc.extract_regex(arr, pattern=REGION_PATTERN)
+    regions = pc.drop_null(pc.struct_field(extracted, "region"))
+    counts = pc.value_counts(regions)
+    order = pc.array_sort_indices(counts.field("counts"), order="descending")[:n]
+    return list(zip(
+        pc.take(counts.field("values"), order).to_pylist(),
+        pc.take(counts.field("counts"), order).to_pylist(),
+    ))
+
 
 def main():
     client = USGSClient()
@@ -29,8 +63,8 @@ def main():
     print()
 
     result = client.extract(
-        start_date=start.strftime("%Y-%m-%d"),
-        end_date=end.strftime("%Y-%m-%d"),
+        start_date=start,
+        end_date=end,
         min_magnitude=4.5,
         max_results=2000,
     )
@@ -53,24 +87,28 @@ def main():
     # Top 10 by magnitude
     print("--- Top 10 Earthquakes by Magnitude ---")
     top = df.nlargest(10, "magnitude")[["magnitude", "place", "time", "depth"]]
-    for _, row in top.iterrows():
-        print(f"  M{row['magnitude']:.1f}  {row['place']}")
+    if not top.empty:
+        # Format whole columns and join once instead of printing per row
+        lines = "  M" + top["magnitude"].map("{:.1f}".format) + "  " + top["place"].map(str)
+        print("\n".join(lines))
     print()
 
     # Geographic distribution
     print("--- Geographic Distribution ---")
     if "place" in df.columns:
         # Extract rough region from place description
-        regions = df["place"].str.extract(r",\s*(.+)$")[0].value_counts().head(10)
-        for region, count in regions.items():
+        for region, count in top_regions(df["place"]):
             print(f"  {region}: {count} events")
     print()
 
     # Depth statistics
     print("--- Depth Statistics ---")
-    print(f"  Mean depth:   {df['depth'].mean():.1f} km")
-    print(f"  Median depth: {df['depth'].median():.1f} km")
-    print(f"  Max depth:    {df['depth'].max():.1f} km")
+    depth = df["depth"].to_numpy(dtype=np.float64, na_value=np.nan)
+    depth = depth[~np.isnan(depth)]
+    if depth.size:
+        print(f"  Mean depth:   {depth.mean():.1f} km")
+        print(f"  Median depth: {np.median(depth):.1f} km")
+        print(f"  Max depth:    {depth.max():.1f} km")
 
 
 if __name__ == "__main__":
@@ -50,23 +50,28 @@ def main():
 
     # GDP per capita — latest year
     print("--- GDP per Capita (Latest Available Year) ---")
-    gdp = df[df["indicator_code"] == "NY.GDP.PCAP.CD"].dropna(subset=["value"])
+    gdp = df[df["indicator_code"] == "NY.GDP.PCAP.CD"].dropna(subset=["value", "year"])
     if not gdp.empty:
-        latest = gdp.loc[gdp.groupby("country_code")["year"].idxmax()]
+        latest = gdp.sort_values("year", kind="mergesort").drop_duplicates("country_code", keep="last")
         latest = latest.sort_values("value", ascending=False)
-        for _, row in latest.iterrows():
-            print(f"  {row['country_name']:20s}  ${row['value']:>12,.0f}  ({int(row['year'])})")
+        # Format whole columns and join once instead of printing per row
+        lines = (
+            "  " + latest["country_name"].map("{:20s}".format)
+            + "  $" + latest["value"].map("{:>12,.0f}".format)
+            + "  (" + latest["year"].astype("int64").astype(str) + ")"
+        )
+        print("\n".join(lines))
     print()
 
     # Population — latest year
     print("--- Population (Latest Available Year) ---")
-    pop = df[df["indicator_code"] == "SP.POP.TOTL"].dropna(subset=["value"])
+    pop = df[df["indicator_code"] == "SP.POP.TOTL"].dropna(subset=["value", "year"])
     if not pop.empty:
-        latest = pop.loc[pop.groupby("country_code")["year"].idxmax()]
+        latest = pop.sort_values("year", kind="mergesort").drop_duplicates("country_code", keep="last")
         latest = latest.sort_values("value", ascending=False)
-        for _, row in latest.iterrows():
-            pop_m = row["value"] / 1_000_000
-            print(f"  {row['country_name']:20s}  {pop_m:>8,.1f}M  ({int(row['year'])})")
+        for row in latest.itertuples(index=False):
+            pop_m = row.value / 1_000_000
+            print(f"  {row.country_name:20s}  {pop_m:>8,.1f}M  ({int(row.year)})")
     print()
 
     # Data coverage
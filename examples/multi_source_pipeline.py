@@ -13,6 +13,9 @@ import sys
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
+import numpy as np
+import pandas as pd
+
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 from src.extractors.usgs import USGSClient
@@ -34,6 +37,35 @@ COUNTRIES = {
 }
 
 
+def _lookup(values: dict, key: str, name: str) -> pd.DataFrame:
+    """Turn a ``{key: value}`` map into a two-column frame for merging."""
+    return (
+        pd.Series(values, name=name, dtype="float64")
+        .rename_axis(key)
+        .reset_index()
+    )
+
+
+def _group_mean(labels, values) -> dict:
+    """Mean of ``values`` per label, skipping NaNs.
+
+    For a handful of labels, one stable sort + ``np.add.reduceat`` beats
+    building a pandas GroupBy (hash table + per-group bookkeeping).
+    """
+    labels = np.asarray(labels, dtype=object)
+    values = np.asarray(values, dtype=np.float64)
+    keep = ~np.isnan(values)
+    labels, values = labels[keep], values[keep]
+    if not values.size:
+        return {}
+
+    order = np.argsort(labels, kind="stable")
+    uniq, starts = np.unique(labels[order], return_index=True)
+    sums = np.add.reduceat(values[order], starts)
+    counts = np.diff(np.append(starts, values.size))
+    return dict(zip(uniq.tolist(), (sums / counts).tolist()))
+
+
 def main():
     print("=" * 70)
     print("Multi-Source ETL Pipeline — Country Economic & Climate Profile")
@@ -61,8 +93,8 @@ def main():
 
     results = collector.collect_all(
         usgs={
-            "start_date": start.strftime("%Y-%m-%d"),
-            "end_date": end.strftime("%Y-%m-%d"),
+            "start_date": start,
+            "end_date": end,
             "min_magnitude": 4.5,
             "max_results": 5000,
         },
@@ -74,8 +106,8 @@ def main():
         },
         open_meteo={
             "locations": locations,
-            "start_date": start.strftime("%Y-%m-%d"),
-            "end_date": end.strftime("%Y-%m-%d"),
+            "start_date": start,
+            "end_date": end,
         },
     )
 
@@ -109,17 +141,15 @@ def main():
     pop_map = {}
     if wb_data and wb_data.success and wb_data.data is not None:
         wb_df = wb_data.data
-        gdp = wb_df[wb_df["indicator_code"] == "NY.GDP.PCAP.CD"].dropna(subset=["value"])
+        gdp = wb_df[wb_df["indicator_code"] == "NY.GDP.PCAP.CD"].dropna(subset=["value", "year"])
         if not gdp.empty:
-            latest = gdp.loc[gdp.groupby("country_code")["year"].idxmax()]
-            for _, row in latest.iterrows():
-                gdp_map[row["country_code"]] = row["value"]
+            latest = gdp.sort_values("year", kind="mergesort").drop_duplicates("country_code", keep="last")
+            gdp_map = dict(zip(latest["country_code"], latest["value"]))
 
-        pop = wb_df[wb_df["indicator_code"] == "SP.POP.TOTL"].dropna(subset=["value"])
+        pop = wb_df[wb_df["indicator_code"] == "SP.POP.TOTL"].dropna(subset=["value", "year"])
         if not pop.empty:
-            latest = pop.loc[pop.groupby("country_code")["year"].idxmax()]
-            for _, row in latest.iterrows():
-                pop_map[row["country_code"]] = row["value"]
+            latest = pop.sort_values("year", kind="mergesort").drop_duplicates("country_code", keep="last")
+            pop_map = dict(zip(latest["country_code"], latest["value"]))
 
     # Average temperature per city
     temp_map = {}
@@ -127,23 +157,38 @@ def main():
     if weather_data and weather_data.success and weather_data.data is not None:
         w_df = weather_data.data
         if "temperature_max" in w_df.columns:
-            avg_temps = w_df.groupby("location")["temperature_max"].mean()
-            temp_map = avg_temps.to_dict()
+            temp_map = _group_mean(
+                w_df["location"].to_numpy(),
+                w_df["temperature_max"].to_numpy(dtype=np.float64, na_value=np.nan),
+            )
+
+    # Join the per-source lookups onto the country table once
+    profile = (
+        pd.DataFrame.from_dict(COUNTRIES, orient="index")
+        .rename_axis("code")
+        .reset_index()
+        .merge(_lookup(gdp_map, "code", "gdp"), on="code", how="left")
+        .merge(_lookup(pop_map, "code", "pop"), on="code", how="left")
+        .merge(_lookup(temp_map, "city", "temp"), on="city", how="left", validate="m:1")
+    )
 
     # Print combined summary
     print("--- Combined Country Profile ---")
     print(f"{'Country':<20s} {'GDP/Cap':>12s} {'Population':>14s} {'Avg Temp':>10s}")
     print("-" * 60)
-    for code, info in COUNTRIES.items():
-        gdp_val = gdp_map.get(code)
-        pop_val = pop_map.get(code)
-        temp_val = temp_map.get(info["city"])
-
-        gdp_str = f"${gdp_val:,.0f}" if gdp_val else "N/A"
-        pop_str = f"{pop_val / 1e6:,.1f}M" if pop_val else "N/A"
-        temp_str = f"{temp_val:.1f}C" if temp_val else "N/A"
-
-        print(f"  {info['name']:<18s} {gdp_str:>12s} {pop_str:>14s} {temp_str:>10s}")
+    print(profile.to_string(
+        columns=["name", "gdp", "pop", "temp"],
+        header=False,
+        index=False,
+        na_rep="N/A",
+        col_space={"gdp": 12, "pop": 14, "temp": 10},
+        formatters={
+            "name": "  {:<18s}".format,
+            "gdp": "${:,.0f}".format,
+            "pop": lambda v: f"{v / 1e6:,.1f}M",
+            "temp": "{:.1f}C".format,
+        },
+    ))
 
     print()
     print("Data sources: USGS, World Bank, Open-Meteo (all public, no API keys)")
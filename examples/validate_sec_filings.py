@@ -12,12 +12,30 @@ Usage:
     python examples/validate_sec_filings.py
 """
 
+import json
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from pathlib import Path
+from typing import Dict, List
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 import requests
 
+try:
+    from orjson import loads as json_loads
+except ImportError:  # optional: faster parsing of the multi-MB tickers file
+    from json import loads as json_loads
+
+try:
+    import requests_cache
+except ImportError:  # optional: reuse EDGAR filings searches between runs
+    requests_cache = None
+
 # Allow imports from src/
 sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
@@ -29,6 +47,13 @@ from quality import (
     CustomRule,
 )
 
+# On pandas 2.x, keep the ~10k company names and tickers as Arrow strings
+# rather than Python objects (pandas 3 already does this)
+try:
+    pd.set_option('future.infer_string', True)
+except pd.errors.OptionError:
+    pass
+
 HEADERS = {
     'User-Agent': 'DataQualityFramework/1.0 (github.com/mboyajeffers)',
     'Accept': 'application/json',
@@ -36,39 +61,133 @@ HEADERS = {
 
 COMPANY_TICKERS_URL = 'https://www.sec.gov/files/company_tickers.json'
 
+# Local copy of the parsed tickers file, revalidated with conditional GETs
+TICKERS_CACHE_DIR = Path.home() / '.cache' / 'financial-data-engineering'
+TICKERS_CACHE_FILE = TICKERS_CACHE_DIR / 'sec_tickers.feather'
+TICKERS_META_FILE = TICKERS_CACHE_DIR / 'sec_tickers.meta.json'
+
+# SEC EDGAR fair-access policy: at most 10 requests per second
+SEC_MAX_REQUESTS_PER_SECOND = 10
+
+# requests-cache only covers the filings searches: repeat runs reuse them,
+# and a transient 429/5xx falls back to the last good response. The
+# tickers file bypasses it and relies on the Feather/ETag cache below.
+if requests_cache is not None:
+    requests_cache.install_cache(
+        'http_cache',
+        backend='sqlite',
+        expire_after=3600,
+        allowable_methods=('GET', 'POST'),
+        stale_if_error=True,
+    )
+
 
 def fetch_sec_company_tickers() -> pd.DataFrame:
     """
     Fetch the SEC company tickers file.
 
-    Returns a DataFrame with columns: cik, name, ticker, exchange.
+    Returns a DataFrame with columns: cik, ticker, company_name.
     This file contains ~10,000 public company registrations.
+
+    The parsed frame is kept in ``~/.cache/financial-data-engineering``
+    together with the response's ETag / Last-Modified headers. Later
+    runs send a conditional GET; on ``304 Not Modified`` the cached frame
+    is loaded from Feather and no body is downloaded or parsed. If the
+    request fails (429/5xx or a network error), the cached frame is used.
     """
     print("Fetching SEC company tickers...")
-    resp = requests.get(COMPANY_TICKERS_URL, headers=HEADERS, timeout=30)
+    cached, meta = _read_tickers_cache()
+
+    headers = dict(HEADERS)
+    if cached is not None:
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+
+    # The Feather copy is this URL's cache; requests-cache would answer
+    # with its own stored 200 and the server's 304 would never be seen
+    no_http_cache = requests_cache.disabled() if requests_cache is not None else nullcontext()
+    try:
+        with no_http_cache:
+            resp = requests.get(COMPANY_TICKERS_URL, headers=headers, timeout=30)
+    except requests.RequestException as exc:
+        if cached is None:
+            raise
+        print(f"  Request failed ({exc}); loaded {len(cached):,} companies from cache")
+        return cached
+
+    if cached is not None and resp.status_code == 304:
+        print(f"  Not modified; loaded {len(cached):,} companies from cache")
+        return cached
+    if cached is not None and not resp.ok:
+        print(f"  HTTP {resp.status_code}; loaded {len(cached):,} companies from cache")
+        return cached
     resp.raise_for_status()
 
-    data = resp.json()
+    df = _tickers_frame(json_loads(resp.content))
+    _write_tickers_cache(df, resp.headers)
 
-    # SEC returns {0: {cik_str, ticker, title}, 1: {...}, ...}
-    records = list(data.values())
-    df = pd.DataFrame(records)
+    print(f"  Fetched {len(df):,} companies from SEC EDGAR")
+    return df
 
-    # Normalize column names
-    df = df.rename(columns={
-        'cik_str': 'cik',
-        'title': 'company_name',
-        'ticker': 'ticker',
+
+def _tickers_frame(data: dict) -> pd.DataFrame:
+    """Normalize the raw tickers JSON into a typed DataFrame."""
+    # SEC returns {0: {cik_str, ticker, title}, 1: {...}, ...}; build the
+    # normalized columns straight from the records (no row-wise frame
+    # construction or rename copy)
+    records = data.values()
+    df = pd.DataFrame({
+        'cik': [r.get('cik_str') for r in records],
+        'ticker': [r.get('ticker') for r in records],
+        'company_name': [r.get('title') for r in records],
     })
 
-    # Pad CIK to 10 digits (SEC standard format)
-    df['cik'] = df['cik'].astype(str).str.zfill(10)
+    # Pad CIK to 10 digits (SEC standard format) with one Arrow kernel
+    # over the integer column, rather than int->str->zfill object passes
+    cik = pc.cast(pa.array(df['cik'], type=pa.int64()), pa.string())
+    df['cik'] = pd.arrays.ArrowStringArray(pc.utf8_lpad(cik, width=10, padding='0'))
 
-    print(f"  Fetched {len(df):,} companies from SEC EDGAR")
-    return df
+    # Arrow-backed strings: PatternRule matches these natively with RE2
+    return df.astype({
+        'cik': 'string[pyarrow]',
+        'company_name': 'string[pyarrow]',
+        'ticker': 'string[pyarrow]',
+    })
 
 
-def fetch_sec_filings(cik: str, filing_type: str = '10-K', count: int = 40) -> pd.DataFrame:
+def _read_tickers_cache():
+    """Return (cached frame, validator headers), or (None, {}) if absent."""
+    try:
+        meta = json.loads(TICKERS_META_FILE.read_text())
+        return pd.read_feather(TICKERS_CACHE_FILE), meta
+    except (OSError, ValueError, pa.ArrowException):
+        return None, {}
+
+
+def _write_tickers_cache(df: pd.DataFrame, headers) -> None:
+    """Persist the frame and its validators; caching is best-effort."""
+    meta = {
+        'etag': headers.get('ETag'),
+        'last_modified': headers.get('Last-Modified'),
+    }
+    if not any(meta.values()):
+        return
+    try:
+        TICKERS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        df.to_feather(TICKERS_CACHE_FILE)
+        TICKERS_META_FILE.write_text(json.dumps(meta))
+    except OSError:
+        pass
+
+
+def fetch_sec_filings(
+    cik: str,
+    filing_type: str = '10-K',
+    count: int = 40,
+    session: requests.Session = None,
+) -> pd.DataFrame:
     """
     Fetch recent filings for a single company.
 
@@ -76,14 +195,15 @@ def fetch_sec_filings(cik: str, filing_type: str = '10-K', count: int = 40) -> p
         cik: Central Index Key (10-digit padded).
         filing_type: Filing type to retrieve (10-K, 10-Q, 8-K, etc.).
         count: Maximum filings to return.
+        session: Optional session to reuse pooled keep-alive connections.
     """
     url = f'https://efts.sec.gov/LATEST/search-index?q=%22{cik}%22&dateRange=custom&startdt=2020-01-01&enddt=2025-12-31&forms={filing_type}'
-    resp = requests.get(url, headers=HEADERS, timeout=30)
+    resp = (session or requests).get(url, headers=HEADERS, timeout=30)
 
     if resp.status_code != 200:
         return pd.DataFrame()
 
-    data = resp.json()
+    data = json_loads(resp.content)
     hits = data.get('hits', {}).get('hits', [])
 
     if not hits:
@@ -102,6 +222,41 @@ def fetch_sec_filings(cik: str, filing_type: str = '10-K', count: int = 40) -> p
     return pd.DataFrame(records)
 
 
+def fetch_many_sec_filings(
+    ciks: List[str],
+    filing_type: str = '10-K',
+    count: int = 40,
+    max_workers: int = 8,
+) -> Dict[str, pd.DataFrame]:
+    """
+    Fetch filings for many companies concurrently.
+
+    Requests share one pooled session (one TLS handshake per connection
+    instead of per request) and are spaced to stay within SEC's
+    10 requests/second limit, so throughput is bound by the server
+    policy rather than by serial round trips.
+
+    Returns a dict mapping each CIK to its filings DataFrame.
+    """
+    interval = 1.0 / SEC_MAX_REQUESTS_PER_SECOND
+    lock = threading.Lock()
+    next_slot = [time.monotonic()]
+
+    def throttled_fetch(cik: str) -> pd.DataFrame:
+        with lock:
+            now = time.monotonic()
+            wait = next_slot[0] - now
+            next_slot[0] = max(now, next_slot[0]) + interval
+        if wait > 0:
+            time.sleep(wait)
+        return fetch_sec_filings(cik, filing_type, count, session=session)
+
+    with requests.Session() as session, ThreadPoolExecutor(max_workers=max_workers) as pool:
+        frames = list(pool.map(throttled_fetch, ciks))
+
+    return dict(zip(ciks, frames))
+
+
 def main():
     # --- Step 1: Fetch and validate company tickers ---
     tickers_df = fetch_sec_company_tickers()
@@ -142,7 +297,8 @@ def main():
     # --- Step 2: Fetch and validate filings for a known company ---
     print("\n--- Validating SEC Filings (Apple Inc, CIK 0000320193) ---")
 
-    filings_df = fetch_sec_filings('0000320193', filing_type='10-K')
+    # Same pooled, rate-paced path used for batches of CIKs
+    filings_df = fetch_many_sec_filings(['0000320193'], filing_type='10-K')['0000320193']
 
     if filings_df.empty:
         print("  No filings returned (API may be rate-limited). Skipping.")
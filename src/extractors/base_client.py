@@ -3,26 +3,37 @@ Base API client with built-in rate limiting, caching, and retries.
 
 All source-specific clients inherit from BaseClient, which provides:
 - Token bucket rate limiter (thread-safe, configurable requests/minute)
-- Response cache (in-memory, MD5 keys, configurable TTL)
+- Response cache (in-memory LRU, hashable tuple keys, configurable TTL,
+  ETag / Last-Modified revalidation)
 - Retry with exponential backoff and jitter (skips 4xx)
 - HTTP 429 Retry-After handling
-- Session pooling with custom User-Agent
+- Per-host shared session pooling with custom User-Agent
+- Ordered thread-pool fan-out for independent requests
 - Per-request telemetry
 
 Author: Mboya Jeffers
 """
 
-import hashlib
-import json
 import logging
 import random
 import time
 import threading
 from abc import ABC, abstractmethod
-from datetime import datetime, timezone
-from typing import Any, Dict, Optional, Tuple
-
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timezone
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+from urllib.parse import urlparse
+
+import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+except ImportError:  # optional: decodes large GeoJSON pages several times faster
+    orjson = None
 
 from .result import ExtractionResult
 
@@ -68,86 +79,264 @@ class BaseClient(ABC):
     def extract(self, **kwargs) -> ExtractionResult:
         """Run the extraction and return an ExtractionResult."""
 
+    # Upper bound on concurrent requests issued by ``_map_concurrent``
+    MAX_WORKERS = 8
+
+    # Keep-alive pool sizing: hosts with a cached pool, and connections
+    # kept per host (must cover concurrent workers or sockets get dropped)
+    POOL_CONNECTIONS = 32
+    POOL_MAXSIZE = 64
+
+    # Seconds to wait for a response, and for a concurrent identical
+    # request to finish before fetching independently
+    REQUEST_TIMEOUT = 30
+
+    # Least-recently-used cache entries checked for expiry before evicting
+    EVICTION_SCAN = 5
+
+    # Request headers identifying the source, built once per subclass
+    _headers: Dict[str, str] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if isinstance(cls.source_name, str):
+            cls._headers = cls._identity_headers(cls.source_name)
+
+    @staticmethod
+    def _identity_headers(source_name: str) -> Dict[str, str]:
+        return {
+            "User-Agent": f"financial-data-engineering/{source_name}",
+            "Accept": "application/json",
+        }
+
     # --- Lifecycle ------------------------------------------------------------
 
-    def __init__(self, cache_ttl: int = 300):
+    def __init__(
+        self,
+        cache_ttl: int = 300,
+        cache_max_entries: int = 1024,
+        session: Optional[requests.Session] = None,
+    ):
         """Initialize the client.
 
         Args:
             cache_ttl: Cache time-to-live in seconds (default 5 min).
+            cache_max_entries: Maximum cached responses before the
+                least-recently-used entry is evicted.
+            session: Session to send requests through. Defaults to the
+                process-wide session for this client's host, so every
+                client of one API shares its keep-alive connections.
         """
         self._cache_ttl = cache_ttl
-
-        # Session pooling
-        self._session = requests.Session()
-        self._session.headers.update({
-            "User-Agent": f"financial-data-engineering/{self.source_name}",
-            "Accept": "application/json",
-        })
-
-        # Token bucket rate limiter
-        self._tokens = float(self.rate_limit)
-        self._max_tokens = float(self.rate_limit)
-        self._refill_rate = self.rate_limit / 60.0  # tokens per second
-        self._last_refill = time.monotonic()
+        self._cache_ttl_ns = int(cache_ttl * 1_000_000_000)
+        self._cache_max_entries = cache_max_entries
+
+        # Session pooling; identity headers (``_headers``, built once per
+        # class) go on each request because the session may be shared
+        self._session = session or self._host_session(urlparse(self.base_url).netloc)
+        if not isinstance(type(self).source_name, str):
+            # source_name is a property here, so it can't be read per class
+            self._headers = self._identity_headers(self.source_name)
+
+        # Token bucket rate limiter, in integer nanoseconds: the bucket is
+        # tracked as the instant it runs empty, which moves one refill
+        # interval forward per token taken (starts full)
+        self._interval_ns = 60_000_000_000 // self.rate_limit
+        self._capacity_ns = self.rate_limit * self._interval_ns
+        self._empty_at_ns = time.monotonic_ns() - self._capacity_ns
         self._lock = threading.Lock()
 
-        # Response cache: key -> (response_json, expiry_timestamp)
-        self._cache: Dict[str, Tuple[Any, float]] = {}
+        # Response cache: (url, sorted params) ->
+        # (response_json, expiry_monotonic_ns, etag, last_modified),
+        # ordered from least to most recently used
+        self._cache: "OrderedDict[Tuple, Tuple]" = OrderedDict()
+        self._cache_lock = threading.Lock()
 
-        # Telemetry counters
+        # Cache misses currently being fetched: key -> done event
+        self._inflight: Dict[Tuple, threading.Event] = {}
+        self._inflight_lock = threading.Lock()
+
+        # Telemetry counters; updated from fan-out threads under _stats_lock
+        self._stats_lock = threading.Lock()
         self.api_calls = 0
         self.cache_hits = 0
         self.errors = 0
-        self._timings: list = []
+        # Request latency as running totals: O(1) memory and average
+        self._latency_sum = 0.0
+        self._latency_count = 0
 
         # Logger
         self._log = logging.getLogger(f"extractor.{self.source_name}")
 
+        # Set by close(); retry backoffs wait on it so they end immediately
+        self._wake = threading.Event()
+
+    def _attach_session(self, session: requests.Session) -> None:
+        """Send this client's requests through ``session`` from now on.
+
+        Headers are passed per request, so sharing a session never mixes
+        up client identities.
+        """
+        self._session = session
+
+    def close(self) -> None:
+        """Cancel pending rate-limit waits and retry backoffs.
+
+        Throttled callers raise instead of sending; in-flight retries
+        give up with their last error.
+
+        The session is left open since it may be shared with other
+        clients of the same host.
+        """
+        self._wake.set()
+
+    # Process-wide sessions keyed by host (netloc)
+    _session_pool: Dict[str, requests.Session] = {}
+    _session_pool_lock = threading.Lock()
+
+    @classmethod
+    def _host_session(cls, host: str) -> requests.Session:
+        """Return the shared session for ``host``, creating it on first use."""
+        with cls._session_pool_lock:
+            session = cls._session_pool.get(host)
+            if session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=cls.POOL_CONNECTIONS,
+                    pool_maxsize=cls.POOL_MAXSIZE,
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                cls._session_pool[host] = session
+            return session
+
     # --- Rate limiter ---------------------------------------------------------
 
     def _wait_for_token(self) -> None:
-        """Block until a rate-limit token is available."""
-        while True:
-            with self._lock:
-                now = time.monotonic()
-                elapsed = now - self._last_refill
-                self._tokens = min(
-                    self._max_tokens,
-                    self._tokens + elapsed * self._refill_rate,
-                )
-                self._last_refill = now
+        """Block until a rate-limit token is available.
 
-                if self._tokens >= 1.0:
-                    self._tokens -= 1.0
-                    return
+        Each caller reserves its token up front, letting the balance go
+        negative, and then sleeps exactly until that token will have
+        refilled. The lock only guards the arithmetic, so waiting threads
+        never hold it and never wake up to poll an empty bucket.
 
-            # No token available — sleep briefly and retry
-            time.sleep(0.05)
+        Raises:
+            RuntimeError: If the client is closed while waiting.
+        """
+        with self._lock:
+            now = time.monotonic_ns()
+            # Refill is implicit: a bucket idle past capacity is just full
+            self._empty_at_ns = max(self._empty_at_ns, now - self._capacity_ns)
+            self._empty_at_ns += self._interval_ns
+            wait_ns = self._empty_at_ns - now
+
+        if wait_ns > 0 and self._wake.wait(wait_ns / 1e9):
+            raise RuntimeError(f"{self.source_name} client closed while throttled")
 
     # --- Cache ----------------------------------------------------------------
 
-    def _cache_key(self, url: str, params: Optional[Dict] = None) -> str:
-        """Deterministic MD5 cache key from URL + sorted params."""
-        normalized = json.dumps(params or {}, sort_keys=True)
-        raw = f"{url}|{normalized}"
-        return hashlib.md5(raw.encode()).hexdigest()
+    def _cache_key(self, url: str, params: Optional[Dict] = None) -> Tuple:
+        """Deterministic cache key from URL + sorted params.
 
-    def _cache_get(self, key: str) -> Optional[Any]:
-        """Return cached value if present and not expired."""
-        entry = self._cache.get(key)
+        The tuple is used directly as the dict key, so lookups cost one
+        native hash instead of JSON-encoding and digesting the params.
+        List values (repeated query keys) are keyed as tuples.
+        """
+        return (url, tuple(sorted(
+            (k, tuple(v) if isinstance(v, (list, tuple)) else v)
+            for k, v in (params or {}).items()
+        )))
+
+    def _cache_get(self, key: Tuple) -> Optional[Any]:
+        """Return cached value if present and not expired.
+
+        Expired entries that carry an ETag or Last-Modified validator are
+        kept (until evicted) so the next request can revalidate them.
+        """
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            value, expiry, etag, last_modified = entry
+            if time.monotonic_ns() > expiry:
+                if etag is None and last_modified is None:
+                    del self._cache[key]
+                return None
+            self._cache.move_to_end(key)
+            return value
+
+    def _cache_set(
+        self,
+        key: Tuple,
+        value: Any,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        """Store a value in the cache with TTL, evicting if full."""
+        with self._cache_lock:
+            if key not in self._cache and len(self._cache) >= self._cache_max_entries:
+                self._evict()
+            self._cache[key] = (value, time.monotonic_ns() + self._cache_ttl_ns, etag, last_modified)
+            self._cache.move_to_end(key)
+
+    def _cache_validators(self, key: Tuple) -> Dict[str, str]:
+        """Conditional-request headers for a stale entry, if it has any."""
+        with self._cache_lock:
+            entry = self._cache.get(key)
         if entry is None:
-            return None
-        value, expiry = entry
-        if time.time() > expiry:
-            del self._cache[key]
-            return None
+            return {}
+        _, _, etag, last_modified = entry
+        headers = {}
+        if etag is not None:
+            headers["If-None-Match"] = etag
+        if last_modified is not None:
+            headers["If-Modified-Since"] = last_modified
+        return headers
+
+    def _cache_renew(self, key: Tuple) -> Optional[Any]:
+        """Extend a revalidated entry's TTL and return its value."""
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            value, _, etag, last_modified = entry
+            self._cache[key] = (value, time.monotonic_ns() + self._cache_ttl_ns, etag, last_modified)
+            self._cache.move_to_end(key)
+            return value
+
+    def _evict(self) -> None:
+        """Free cache space; caller must hold ``_cache_lock``.
+
+        Expired entries among the least-recently-used few are dropped
+        first; if none have expired, the LRU entry goes. Either way the
+        work is bounded, not a scan of the whole cache.
+        """
+        now = time.monotonic_ns()
+        expired = [
+            k for k, entry in islice(self._cache.items(), self.EVICTION_SCAN)
+            if now > entry[1]
+        ]
+        for k in expired:
+            del self._cache[k]
+        if not expired:
+            self._cache.popitem(last=False)
+
+    # --- Parameter helpers ----------------------------------------------------
+
+    @staticmethod
+    def _format_date(value: Union[str, date]) -> str:
+        """Serialize a date parameter as ``YYYY-MM-DD``.
+
+        Accepts ``date``/``datetime`` objects or ISO strings (passed
+        through unchanged), so callers can hand over datetimes and the
+        string is built once at the API boundary.
+        """
+        if isinstance(value, datetime):
+            return value.date().isoformat()
+        if isinstance(value, date):
+            return value.isoformat()
         return value
 
-    def _cache_set(self, key: str, value: Any) -> None:
-        """Store a value in the cache with TTL."""
-        self._cache[key] = (value, time.time() + self._cache_ttl)
-
     # --- HTTP with retries ----------------------------------------------------
 
     def _get(
@@ -172,27 +361,76 @@ class BaseClient(ABC):
             requests.HTTPError: On non-retryable HTTP errors.
         """
         url = f"{self.base_url}{path}" if path.startswith("/") else path
+        if not use_cache:
+            return self._fetch(url, params, max_retries)
 
         # Check cache first
-        if use_cache:
-            key = self._cache_key(url, params)
+        key = self._cache_key(url, params)
+        cached = self._cache_get(key)
+        if cached is not None:
+            self._count("cache_hits")
+            self._log.debug("Cache hit: %s", url)
+            return cached
+
+        # Single-flight: concurrent misses on one key share a single fetch
+        with self._inflight_lock:
+            event = self._inflight.get(key)
+            leader = event is None
+            if leader:
+                event = self._inflight[key] = threading.Event()
+
+        if not leader:
+            # Bounded: a hung leader must not stall its followers
+            event.wait(self.REQUEST_TIMEOUT)
             cached = self._cache_get(key)
             if cached is not None:
-                self.cache_hits += 1
-                self._log.debug("Cache hit: %s", key[:8])
+                self._count("cache_hits")
+                self._log.debug("Joined in-flight request: %s", url)
                 return cached
+            # The leading request failed or is still running; try on our own
+            return self._fetch(url, params, max_retries, key)
+
+        try:
+            return self._fetch(url, params, max_retries, key)
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+            event.set()
+
+    def _fetch(
+        self,
+        url: str,
+        params: Optional[Dict],
+        max_retries: int,
+        key: Optional[Tuple] = None,
+    ) -> Any:
+        """Send the GET with retries; cache the result under ``key`` if given."""
+        # Stale entry: ask the server to confirm it instead of resending
+        conditional = self._cache_validators(key) if key is not None else {}
 
         # Retry loop
         last_error = None
         for attempt in range(max_retries + 1):
-            self._wait_for_token()
-            self.api_calls += 1
-            start = time.monotonic()
-
             try:
-                resp = self._session.get(url, params=params, timeout=30)
-                elapsed = time.monotonic() - start
-                self._timings.append(elapsed)
+                resp = self._send(url, params, conditional)
+
+                # 304 Not Modified — the stale cached body is still current
+                if resp.status_code == 304 and conditional:
+                    data = self._cache_renew(key)
+                    if data is not None:
+                        self._log.debug("Not modified: %s", url)
+                        return data
+                    # Entry evicted meanwhile; refetch in full within this
+                    # attempt (the follow-up is unconditional, so runs once)
+                    conditional = {}
+                    resp = self._send(url, params, conditional)
+
+                # A 304 we never asked for carries no body to return
+                if resp.status_code == 304:
+                    self._count("errors")
+                    raise requests.HTTPError(
+                        "304 Not Modified without a conditional request", response=resp
+                    )
 
                 # 429 Too Many Requests — honour Retry-After
                 if resp.status_code == 429:
@@ -200,12 +438,14 @@ class BaseClient(ABC):
                     self._log.warning(
                         "Rate limited (429). Retry-After: %ds", retry_after
                     )
-                    time.sleep(retry_after)
+                    last_error = requests.HTTPError("429", response=resp)
+                    if attempt < max_retries and self._wake.wait(retry_after):
+                        break  # client closed: stop retrying
                     continue
 
                 # 4xx (except 429) — don't retry
                 if 400 <= resp.status_code < 500:
-                    self.errors += 1
+                    self._count("errors")
                     resp.raise_for_status()
 
                 # 5xx — retry with backoff
@@ -218,43 +458,77 @@ class BaseClient(ABC):
                     last_error = requests.HTTPError(
                         f"{resp.status_code}", response=resp
                     )
-                    time.sleep(wait)
+                    if attempt < max_retries and self._wake.wait(wait):
+                        break  # client closed: stop retrying
                     continue
 
                 # Success
-                data = resp.json()
-                if use_cache:
-                    self._cache_set(key, data)
+                data = orjson.loads(resp.content) if orjson is not None else resp.json()
+                if key is not None:
+                    self._cache_set(
+                        key, data,
+                        etag=resp.headers.get("ETag"),
+                        last_modified=resp.headers.get("Last-Modified"),
+                    )
                 return data
 
             except requests.ConnectionError as exc:
-                elapsed = time.monotonic() - start
-                self._timings.append(elapsed)
-                self.errors += 1
+                self._count("errors")
                 last_error = exc
                 wait = (2 ** attempt) + random.uniform(0, 1)
                 self._log.warning(
                     "Connection error, retry %d/%d in %.1fs",
                     attempt + 1, max_retries, wait,
                 )
-                if attempt < max_retries:
-                    time.sleep(wait)
+                if attempt < max_retries and self._wake.wait(wait):
+                    break  # client closed: stop retrying
 
-        # Exhausted retries
-        self.errors += 1
+        # Exhausted retries (or closed mid-backoff)
+        self._count("errors")
         raise last_error  # type: ignore[misc]
 
+    def _send(self, url: str, params: Optional[Dict], conditional: Dict[str, str]) -> requests.Response:
+        """Issue one rate-limited GET, counting it and timing it."""
+        self._wait_for_token()
+        self._count("api_calls")
+        start = time.monotonic()
+        try:
+            return self._session.get(
+                url,
+                params=params,
+                headers={**self._headers, **conditional},
+                timeout=self.REQUEST_TIMEOUT,
+            )
+        finally:
+            self._record_latency(time.monotonic() - start)
+
+    # --- Concurrency ----------------------------------------------------------
+
+    def _map_concurrent(self, func: Callable, items: Iterable) -> List:
+        """Apply ``func`` to each item on a thread pool, preserving order.
+
+        Used to overlap independent requests (locations, indicators,
+        pages). The token bucket is thread-safe, so the fan-out still
+        honours ``rate_limit``. The first exception raised by ``func``
+        propagates to the caller.
+        """
+        items = list(items)
+        if len(items) <= 1:
+            return [func(item) for item in items]
+
+        workers = min(len(items), self.MAX_WORKERS)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(func, items))
+
     # --- Result builder -------------------------------------------------------
 
     def _build_result(
         self,
-        data,
+        data: Optional[pd.DataFrame],
         started_at: datetime,
         warnings: Optional[list] = None,
     ) -> ExtractionResult:
         """Build a successful ExtractionResult from a DataFrame."""
-        import pandas as pd
-
         completed = datetime.now(timezone.utc)
         records = len(data) if isinstance(data, pd.DataFrame) else 0
         return ExtractionResult(
@@ -289,6 +563,17 @@ class BaseClient(ABC):
 
     # --- Telemetry ------------------------------------------------------------
 
+    def _count(self, counter: str) -> None:
+        """Increment a telemetry counter; safe across worker threads."""
+        with self._stats_lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def _record_latency(self, seconds: float) -> None:
+        """Fold one request's latency into the running totals."""
+        with self._stats_lock:
+            self._latency_sum += seconds
+            self._latency_count += 1
+
     def get_telemetry(self) -> Dict[str, Any]:
         """Return telemetry summary for this client."""
         return {
@@ -297,15 +582,17 @@ class BaseClient(ABC):
             "cache_hits": self.cache_hits,
             "errors": self.errors,
             "avg_latency": (
-                sum(self._timings) / len(self._timings)
-                if self._timings
+                self._latency_sum / self._latency_count
+                if self._latency_count
                 else 0.0
             ),
         }
 
     def reset_telemetry(self) -> None:
         """Reset all telemetry counters."""
-        self.api_calls = 0
-        self.cache_hits = 0
-        self.errors = 0
-        self._timings.clear()
+        with self._stats_lock:
+            self.api_calls = 0
+            self.cache_hits = 0
+            self.errors = 0
+            self._latency_sum = 0.0
+            self._latency_count = 0
@@ -5,8 +5,8 @@ Fetches historical weather data from archive.open-meteo.com using
 array-style responses (parallel time-series arrays).
 """
 
-from datetime import datetime, timezone
-from typing import List, Optional, Tuple
+from datetime import date, datetime, timezone
+from typing import List, Optional, Tuple, Union
 
 import pandas as pd
 
@@ -47,11 +47,19 @@ class OpenMeteoClient(BaseClient):
         "wind_speed_10m_max",
     ]
 
+    # API variable name -> output column name
+    COLUMN_MAP = {
+        "temperature_2m_max": "temperature_max",
+        "temperature_2m_min": "temperature_min",
+        "precipitation_sum": "precipitation",
+        "wind_speed_10m_max": "wind_speed_max",
+    }
+
     def extract(
         self,
         locations: Optional[List[Tuple[float, float, str]]] = None,
-        start_date: str = "2024-01-01",
-        end_date: str = "2024-12-31",
+        start_date: Union[str, date] = "2024-01-01",
+        end_date: Union[str, date] = "2024-12-31",
         variables: Optional[List[str]] = None,
         **kwargs,
     ) -> ExtractionResult:
@@ -60,8 +68,8 @@ class OpenMeteoClient(BaseClient):
         Args:
             locations: List of (latitude, longitude, name) tuples.
                 Defaults to a small set of world capitals.
-            start_date: ISO date string for range start.
-            end_date: ISO date string for range end.
+            start_date: Range start, as a date/datetime or ISO string.
+            end_date: Range end, as a date/datetime or ISO string.
             variables: Daily weather variables to request.
 
         Returns:
@@ -69,6 +77,8 @@ class OpenMeteoClient(BaseClient):
         """
         started = datetime.now(timezone.utc)
         self.reset_telemetry()
+        start_date = self._format_date(start_date)
+        end_date = self._format_date(end_date)
 
         if locations is None:
             locations = [
@@ -79,13 +89,20 @@ class OpenMeteoClient(BaseClient):
         if variables is None:
             variables = self.DEFAULT_VARIABLES
 
+        # Resolve output column names once, not per location
+        columns = tuple((var, self.COLUMN_MAP.get(var, var)) for var in variables)
+
         try:
-            frames = []
-            for lat, lon, name in locations:
-                df = self._fetch_location(lat, lon, name, start_date, end_date, variables)
-                frames.append(df)
+            # Locations are independent requests: fetch them concurrently
+            frames = self._map_concurrent(
+                lambda loc: self._fetch_location(*loc, start_date, end_date, columns),
+                locations,
+            )
 
             combined = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+            if "location" in combined.columns:
+                # A handful of names repeated per day: store as codes
+                combined["location"] = combined["location"].astype("category")
             return self._build_result(combined, started)
         except Exception as exc:
             return self._build_error(str(exc), started)
@@ -99,15 +116,18 @@ class OpenMeteoClient(BaseClient):
         name: str,
         start_date: str,
         end_date: str,
-        variables: List[str],
+        columns: Tuple[Tuple[str, str], ...],
     ) -> pd.DataFrame:
-        """Fetch weather data for a single location."""
+        """Fetch weather data for a single location.
+
+        ``columns`` pairs each API variable with its output column name.
+        """
         params = {
             "latitude": lat,
             "longitude": lon,
             "start_date": start_date,
             "end_date": end_date,
-            "daily": ",".join(variables),
+            "daily": ",".join(var for var, _ in columns),
             "timezone": "UTC",
         }
 
@@ -117,20 +137,10 @@ class OpenMeteoClient(BaseClient):
         if not daily or "time" not in daily:
             return pd.DataFrame()
 
-        # Build DataFrame from parallel arrays
-        records = {"location": name, "date": daily["time"]}
-
-        column_map = {
-            "temperature_2m_max": "temperature_max",
-            "temperature_2m_min": "temperature_min",
-            "precipitation_sum": "precipitation",
-            "wind_speed_10m_max": "wind_speed_max",
-        }
-
-        for var in variables:
-            col_name = column_map.get(var, var)
-            records[col_name] = daily.get(var, [None] * len(daily["time"]))
-
-        df = pd.DataFrame(records)
-        df["date"] = pd.to_datetime(df["date"])
-        return df
+        # Build DataFrame from parallel arrays in a single construction
+        n = len(daily["time"])
+        return pd.DataFrame({
+            "location": name,
+            "date": pd.to_datetime(daily["time"]),
+            **{col: daily.get(var, [None] * n) for var, col in columns},
+        })
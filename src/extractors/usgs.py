@@ -5,7 +5,8 @@ Fetches seismic event data from earthquake.usgs.gov using
 offset-based pagination over GeoJSON responses.
 """
 
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
+from typing import Union
 
 import pandas as pd
 
@@ -38,8 +39,8 @@ class USGSClient(BaseClient):
 
     def extract(
         self,
-        start_date: str = "2025-01-01",
-        end_date: str = "2025-12-31",
+        start_date: Union[str, date] = "2025-01-01",
+        end_date: Union[str, date] = "2025-12-31",
         min_magnitude: float = 4.5,
         max_results: int = 2000,
         **kwargs,
@@ -47,8 +48,8 @@ class USGSClient(BaseClient):
         """Fetch earthquakes within the given parameters.
 
         Args:
-            start_date: ISO date string for range start.
-            end_date: ISO date string for range end.
+            start_date: Range start, as a date/datetime or ISO string.
+            end_date: Range end, as a date/datetime or ISO string.
             min_magnitude: Minimum magnitude filter.
             max_results: Cap on total records returned.
 
@@ -57,6 +58,8 @@ class USGSClient(BaseClient):
         """
         started = datetime.now(timezone.utc)
         self.reset_telemetry()
+        start_date = self._format_date(start_date)
+        end_date = self._format_date(end_date)
 
         try:
             records = self._paginate(
@@ -117,20 +120,26 @@ class USGSClient(BaseClient):
                 ]
             )
 
-        rows = []
+        # One list per column, filled in a single pass; timestamps are
+        # converted in one vectorized call instead of once per feature
+        columns = {
+            name: [] for name in (
+                "id", "magnitude", "place", "time",
+                "latitude", "longitude", "depth", "type", "status",
+            )
+        }
         for f in features:
             props = f.get("properties", {})
             coords = f.get("geometry", {}).get("coordinates", [None, None, None])
-            rows.append({
-                "id": f.get("id"),
-                "magnitude": props.get("mag"),
-                "place": props.get("place"),
-                "time": pd.to_datetime(props.get("time"), unit="ms", utc=True),
-                "latitude": coords[1] if len(coords) > 1 else None,
-                "longitude": coords[0] if coords else None,
-                "depth": coords[2] if len(coords) > 2 else None,
-                "type": props.get("type"),
-                "status": props.get("status"),
-            })
-
-        return pd.DataFrame(rows)
+            columns["id"].append(f.get("id"))
+            columns["magnitude"].append(props.get("mag"))
+            columns["place"].append(props.get("place"))
+            columns["time"].append(props.get("time"))
+            columns["latitude"].append(coords[1] if len(coords) > 1 else None)
+            columns["longitude"].append(coords[0] if coords else None)
+            columns["depth"].append(coords[2] if len(coords) > 2 else None)
+            columns["type"].append(props.get("type"))
+            columns["status"].append(props.get("status"))
+
+        columns["time"] = pd.to_datetime(columns["time"], unit="ms", utc=True)
+        return pd.DataFrame(columns)
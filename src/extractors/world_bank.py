@@ -71,12 +71,13 @@ class WorldBankClient(BaseClient):
             indicators = self.DEFAULT_INDICATORS
 
         try:
-            frames = []
             country_str = ";".join(countries)
 
-            for indicator in indicators:
-                df = self._fetch_indicator(country_str, indicator, start_year, end_year)
-                frames.append(df)
+            # Indicators are independent requests: fetch them concurrently
+            frames = self._map_concurrent(
+                lambda ind: self._fetch_indicator(country_str, ind, start_year, end_year),
+                indicators,
+            )
 
             combined = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
             return self._build_result(combined, started)
@@ -92,35 +93,38 @@ class WorldBankClient(BaseClient):
         start_year: int,
         end_year: int,
     ) -> pd.DataFrame:
-        """Fetch all pages for a single indicator."""
-        all_records: list = []
-        page = 1
+        """Fetch all pages for a single indicator.
+
+        Page 1 is fetched first to learn the page count from its
+        metadata; the remaining pages are then requested concurrently
+        and their records concatenated in page order.
+        """
+        path = f"/country/{country_str}/indicator/{indicator}"
 
-        while True:
+        def fetch_page(page: int) -> Optional[list]:
             params = {
                 "format": "json",
                 "date": f"{start_year}:{end_year}",
                 "per_page": 100,
                 "page": page,
             }
-
-            path = f"/country/{country_str}/indicator/{indicator}"
             raw = self._get(path, params=params)
 
             # World Bank returns [metadata, data]
             if not isinstance(raw, list) or len(raw) < 2:
-                break
-
-            metadata, data = raw[0], raw[1]
-            if data is None:
-                break
+                return None
+            return raw
 
-            all_records.extend(data)
+        first = fetch_page(1)
+        if first is None or first[1] is None:
+            return self._parse_records([])
 
-            total_pages = metadata.get("pages", 1)
-            if page >= total_pages:
+        metadata, all_records = first[0], list(first[1])
+        total_pages = metadata.get("pages", 1)
+        for raw in self._map_concurrent(fetch_page, range(2, total_pages + 1)):
+            if raw is None or raw[1] is None:
                 break
-            page += 1
+            all_records.extend(raw[1])
 
         return self._parse_records(all_records)
 
@@ -135,19 +139,26 @@ class WorldBankClient(BaseClient):
                 ]
             )
 
-        rows = []
+        # One list per column, filled in a single pass; numeric columns
+        # are converted once at the end instead of per record
+        country_codes, country_names = [], []
+        indicator_codes, indicator_names = [], []
+        years, values = [], []
         for rec in records:
             country = rec.get("country", {})
             indicator = rec.get("indicator", {})
-            rows.append({
-                "country_code": rec.get("countryiso3code", country.get("id")),
-                "country_name": country.get("value"),
-                "indicator_code": indicator.get("id"),
-                "indicator_name": indicator.get("value"),
-                "year": int(rec["date"]) if rec.get("date") else None,
-                "value": rec.get("value"),
-            })
-
-        df = pd.DataFrame(rows)
-        df["value"] = pd.to_numeric(df["value"], errors="coerce")
-        return df
+            country_codes.append(rec.get("countryiso3code", country.get("id")))
+            country_names.append(country.get("value"))
+            indicator_codes.append(indicator.get("id"))
+            indicator_names.append(indicator.get("value"))
+            years.append(rec.get("date"))
+            values.append(rec.get("value"))
+
+        return pd.DataFrame({
+            "country_code": country_codes,
+            "country_name": country_names,
+            "indicator_code": indicator_codes,
+            "indicator_name": indicator_names,
+            "year": pd.to_numeric(pd.Series(years), errors="coerce").astype("Int64"),
+            "value": pd.to_numeric(values, errors="coerce"),
+        })
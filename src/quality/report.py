@@ -5,11 +5,16 @@ Structures rule results into a human-readable report with
 pass/fail counts, failure details, and summary statistics.
 """
 
+import sys
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Dict, List
 
 from .rules import RuleResult
 
+_BAR = '=' * 60
+_DASH = '-' * 56
+
 
 @dataclass
 class ValidationReport:
@@ -21,6 +26,10 @@ class ValidationReport:
         results: List of individual rule results.
         row_count: Number of rows in the validated DataFrame.
         column_count: Number of columns in the validated DataFrame.
+
+    ``results`` is treated as final once the report is built: the
+    failure list is computed on first use and reused by the counts,
+    ``to_dict`` and the print helpers.
     """
     name: str
     results: List[RuleResult]
@@ -29,22 +38,22 @@ class ValidationReport:
 
     @property
     def passed(self) -> bool:
-        """True if every rule passed."""
+        """True if every rule passed (stops at the first failure)."""
         return all(r.passed for r in self.results)
 
     @property
     def pass_count(self) -> int:
-        return sum(1 for r in self.results if r.passed)
+        return self.total_rules - self.fail_count
 
     @property
     def fail_count(self) -> int:
-        return sum(1 for r in self.results if not r.passed)
+        return len(self.failures)
 
     @property
     def total_rules(self) -> int:
         return len(self.results)
 
-    @property
+    @cached_property
     def failures(self) -> List[RuleResult]:
         """Return only failed results."""
         return [r for r in self.results if not r.passed]
@@ -75,12 +84,16 @@ class ValidationReport:
     def print_summary(self) -> None:
         """Print a concise summary to stdout."""
         status = 'PASSED' if self.passed else 'FAILED'
-        print(f"\n{'=' * 60}")
-        print(f"  Validation: {self.name}")
-        print(f"  Status:     {status}")
-        print(f"  Rules:      {self.pass_count}/{self.total_rules} passed")
-        print(f"  Data:       {self.row_count:,} rows x {self.column_count} columns")
-        print(f"{'=' * 60}")
+        lines = [
+            '',
+            _BAR,
+            f"  Validation: {self.name}",
+            f"  Status:     {status}",
+            f"  Rules:      {self.pass_count}/{self.total_rules} passed",
+            f"  Data:       {self.row_count:,} rows x {self.column_count} columns",
+            _BAR,
+        ]
+        sys.stdout.write('\n'.join(lines) + '\n')
 
     def print_failures(self) -> None:
         """Print details of failed rules."""
@@ -88,12 +101,14 @@ class ValidationReport:
             print("  No failures.")
             return
 
-        print(f"\n  Failures ({self.fail_count}):")
-        print(f"  {'-' * 56}")
+        # Build the whole block and write it once: large failure lists
+        # would otherwise pay a stdout round trip per line
+        lines = ['', f"  Failures ({self.fail_count}):", f"  {_DASH}"]
         for r in self.failures:
-            print(f"  FAIL  {r.rule_name}")
+            lines.append(f"  FAIL  {r.rule_name}")
             if r.column:
-                print(f"        column: {r.column}")
+                lines.append(f"        column: {r.column}")
             for key, val in r.details.items():
-                print(f"        {key}: {val}")
-            print()
+                lines.append(f"        {key}: {val}")
+            lines.append('')
+        sys.stdout.write('\n'.join(lines) + '\n')
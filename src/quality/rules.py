@@ -5,11 +5,18 @@ Each rule encapsulates a single data quality check. Rules are composable
 via RuleSet and return structured results for reporting.
 """
 
+import hashlib
+import re
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 
 
 @dataclass
@@ -26,7 +33,13 @@ class RuleResult:
 
 
 class Rule(ABC):
-    """Base class for all validation rules."""
+    """Base class for all validation rules.
+
+    ``pure`` marks rules whose result depends only on the DataFrame's
+    contents, which makes them safe to serve from RuleSet's cache.
+    """
+
+    pure = True
 
     def __init__(self, name: Optional[str] = None):
         self.name = name or self.__class__.__name__
@@ -47,18 +60,31 @@ class CompletenessRule(Rule):
     """
 
     def __init__(self, columns: List[str], threshold: float = 1.0, name: Optional[str] = None):
-        super().__init__(name or f"completeness_{','.join(columns)}")
+        self._column_label = ','.join(columns)
+        super().__init__(name or f"completeness_{self._column_label}")
         self.columns = columns
         self.threshold = threshold
 
     def evaluate(self, df: pd.DataFrame) -> RuleResult:
+        present = [c for c in dict.fromkeys(self.columns) if c in df.columns]
+        total = len(df)
+
+        # Arrow-backed columns carry their null count in the array
+        # metadata; the rest are counted with one frame reduction
+        null_by_col = {
+            c: pa.array(df[c]).null_count
+            for c in present if _is_arrow_backed(df[c].dtype)
+        }
+        scan = [c for c in present if c not in null_by_col]
+        if scan:
+            null_by_col.update(zip(scan, df[scan].isna().sum().to_numpy().tolist()))
+
         failures = {}
         for col in self.columns:
-            if col not in df.columns:
+            if col not in null_by_col:
                 failures[col] = {'error': 'column not found'}
                 continue
-            total = len(df)
-            non_null = int(df[col].notna().sum())
+            non_null = total - int(null_by_col[col])
             ratio = non_null / total if total > 0 else 1.0
             if ratio < self.threshold:
                 failures[col] = {
@@ -70,7 +96,7 @@ class CompletenessRule(Rule):
         return RuleResult(
             rule_name=self.name,
             passed=len(failures) == 0,
-            column=','.join(self.columns),
+            column=self._column_label,
             details={'failures': failures} if failures else {},
         )
 
@@ -84,7 +110,8 @@ class UniquenessRule(Rule):
     """
 
     def __init__(self, columns: List[str], name: Optional[str] = None):
-        super().__init__(name or f"uniqueness_{','.join(columns)}")
+        self._column_label = ','.join(columns)
+        super().__init__(name or f"uniqueness_{self._column_label}")
         self.columns = columns
 
     def evaluate(self, df: pd.DataFrame) -> RuleResult:
@@ -93,16 +120,21 @@ class UniquenessRule(Rule):
             return RuleResult(
                 rule_name=self.name,
                 passed=False,
-                column=','.join(self.columns),
+                column=self._column_label,
                 details={'error': f'missing columns: {missing}'},
             )
 
-        dup_mask = df.duplicated(subset=self.columns, keep=False)
+        if len(self.columns) == 1:
+            # Series.duplicated skips DataFrame.duplicated's per-column
+            # factorize-and-combine setup
+            dup_mask = df[self.columns[0]].duplicated(keep=False)
+        else:
+            dup_mask = df.duplicated(subset=self.columns, keep=False)
         dup_count = int(dup_mask.sum())
         return RuleResult(
             rule_name=self.name,
             passed=dup_count == 0,
-            column=','.join(self.columns),
+            column=self._column_label,
             details={
                 'duplicate_rows': dup_count,
                 'unique_rows': len(df) - dup_count,
@@ -142,13 +174,27 @@ class RangeRule(Rule):
                 details={'error': f'column {self.column!r} not found'},
             )
 
-        values = df[self.column].dropna()
-        violations = 0
-
-        if self.min_val is not None:
-            violations += int((values < self.min_val).sum())
-        if self.max_val is not None:
-            violations += int((values > self.max_val).sum())
+        arr = _numeric_values(df[self.column])
+        if arr is None:
+            values = df[self.column].dropna()
+            violations = 0
+            if self.min_val is not None:
+                violations += int((values < self.min_val).sum())
+            if self.max_val is not None:
+                violations += int((values > self.max_val).sum())
+            checked = len(values)
+            min_found = float(values.min()) if checked else None
+            max_found = float(values.max()) if checked else None
+        else:
+            # Numeric fast path: count and reduce on the raw ndarray
+            violations = 0
+            if self.min_val is not None:
+                violations += int(np.count_nonzero(arr < self.min_val))
+            if self.max_val is not None:
+                violations += int(np.count_nonzero(arr > self.max_val))
+            checked = arr.size
+            min_found = float(arr.min()) if checked else None
+            max_found = float(arr.max()) if checked else None
 
         return RuleResult(
             rule_name=self.name,
@@ -156,28 +202,48 @@ class RangeRule(Rule):
             column=self.column,
             details={
                 'violations': violations,
-                'checked': len(values),
-                'min_found': float(values.min()) if len(values) > 0 else None,
-                'max_found': float(values.max()) if len(values) > 0 else None,
+                'checked': checked,
+                'min_found': min_found,
+                'max_found': max_found,
                 'min_allowed': self.min_val,
                 'max_allowed': self.max_val,
             },
         )
 
 
+def _numeric_values(series: pd.Series) -> Optional[np.ndarray]:
+    """Non-null values of a numeric column as an ndarray, else None."""
+    dtype = series.dtype
+    if pd.api.types.is_bool_dtype(dtype) or not pd.api.types.is_numeric_dtype(dtype):
+        return None
+    if dtype.kind in 'iu':
+        if isinstance(dtype, np.dtype):
+            return series.to_numpy()  # cannot hold nulls
+        # Nullable / Arrow integers: stay integral, since float64 would
+        # round values above 2**53
+        return series.dropna().to_numpy(dtype=dtype.numpy_dtype)
+    arr = series.to_numpy(dtype=np.float64, na_value=np.nan)
+    return arr[~np.isnan(arr)]
+
+
 class PatternRule(Rule):
     """
     Check that string values match a regex pattern.
 
+    Values are matched natively with Arrow's RE2 engine (non-Arrow
+    columns are converted to Arrow strings first); patterns RE2 cannot
+    compile fall back to the precompiled Python pattern.
+
     Args:
         column: Column to validate.
-        pattern: Regular expression (matched with str.match).
+        pattern: Regular expression (matched with re.match semantics).
     """
 
     def __init__(self, column: str, pattern: str, name: Optional[str] = None):
         super().__init__(name or f"pattern_{column}")
         self.column = column
         self.pattern = pattern
+        self._regex = re.compile(pattern)
 
     def evaluate(self, df: pd.DataFrame) -> RuleResult:
         if self.column not in df.columns:
@@ -188,9 +254,8 @@ class PatternRule(Rule):
                 details={'error': f'column {self.column!r} not found'},
             )
 
-        values = df[self.column].dropna().astype(str)
-        matches = values.str.match(self.pattern)
-        mismatches = int((~matches).sum())
+        values = df[self.column].dropna()
+        mismatches = self._count_mismatches(values)
 
         return RuleResult(
             rule_name=self.name,
@@ -203,6 +268,41 @@ class PatternRule(Rule):
             },
         )
 
+    def _count_mismatches(self, values: pd.Series) -> int:
+        """Count non-null values that do not match the pattern."""
+        if values.empty:
+            return 0  # all-null or empty column: nothing to convert or match
+        if not _is_arrow_string(values.dtype):
+            # One conversion pass (str() per value, as before) buys the
+            # native matcher below instead of a Python-level regex loop
+            values = values.astype('string[pyarrow]')
+
+        try:
+            # Anchor at the start to keep re.match semantics
+            matches = pc.match_substring_regex(
+                pa.array(values), f"^(?:{self.pattern})"
+            )
+            return len(values) - int(pc.sum(matches).as_py() or 0)
+        except pa.ArrowInvalid:
+            pass  # Not valid RE2 syntax; use Python's engine below
+
+        match = self._regex.match
+        return sum(1 for v in values if match(v) is None)
+
+
+def _is_arrow_backed(dtype) -> bool:
+    """True if ``dtype`` stores its values (and validity) in Arrow buffers."""
+    return isinstance(dtype, pd.ArrowDtype) or (
+        isinstance(dtype, pd.StringDtype) and dtype.storage == 'pyarrow'
+    )
+
+
+def _is_arrow_string(dtype) -> bool:
+    """True if ``dtype`` stores strings in an Arrow buffer."""
+    if isinstance(dtype, pd.ArrowDtype):
+        return pa.types.is_string(dtype.pyarrow_dtype) or pa.types.is_large_string(dtype.pyarrow_dtype)
+    return isinstance(dtype, pd.StringDtype) and dtype.storage == 'pyarrow'
+
 
 class CustomRule(Rule):
     """
@@ -212,6 +312,8 @@ class CustomRule(Rule):
         func: A function that takes a DataFrame and returns (bool, dict).
               The bool is pass/fail, the dict is additional details.
         column: Optional column name for reporting.
+        pure: Set True if ``func`` depends only on the DataFrame, so
+              RuleSet may cache its result. Default False.
     """
 
     def __init__(
@@ -219,10 +321,12 @@ class CustomRule(Rule):
         func: Callable[[pd.DataFrame], tuple],
         name: str = 'custom_rule',
         column: Optional[str] = None,
+        pure: bool = False,
     ):
         super().__init__(name)
         self.func = func
         self.column = column
+        self.pure = pure
 
     def evaluate(self, df: pd.DataFrame) -> RuleResult:
         passed, details = self.func(df)
@@ -243,18 +347,68 @@ class RuleSet:
         rules.add(CompletenessRule(["id", "name"]))
         rules.add(RangeRule("amount", min_val=0))
         results = rules.evaluate(df)
+
+    With ``cache_size > 0``, results are memoized per DataFrame
+    fingerprint (shape, columns, dtypes and a content hash), so
+    re-validating an unchanged frame skips the rule pass. Caching is
+    bypassed while any rule is impure (see ``Rule.pure``).
+
+    With ``max_workers > 1``, rules run on a thread pool. The pandas
+    and Arrow kernels behind the built-in rules release the GIL, so
+    independent rules over a large frame overlap; results keep rule order.
     """
 
-    def __init__(self, name: str = 'default'):
+    def __init__(
+        self,
+        name: str = 'default',
+        cache_size: int = 0,
+        max_workers: Optional[int] = None,
+    ):
         self.name = name
         self.rules: List[Rule] = []
+        self.cache_size = cache_size
+        self.max_workers = max_workers
+        self._cache: "OrderedDict[Tuple, List[RuleResult]]" = OrderedDict()
 
     def add(self, rule: Rule) -> 'RuleSet':
         self.rules.append(rule)
+        self._cache.clear()
         return self
 
     def evaluate(self, df: pd.DataFrame) -> List[RuleResult]:
-        return [rule.evaluate(df) for rule in self.rules]
+        key = self._fingerprint(df) if self._cacheable() else None
+        if key is not None and key in self._cache:
+            self._cache.move_to_end(key)
+            return list(self._cache[key])
+
+        if self.max_workers and self.max_workers > 1 and len(self.rules) > 1:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(self.rules))) as pool:
+                results = list(pool.map(lambda rule: rule.evaluate(df), self.rules))
+        else:
+            results = [rule.evaluate(df) for rule in self.rules]
+
+        if key is not None:
+            self._cache[key] = results
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return list(results)
+
+    def _cacheable(self) -> bool:
+        return self.cache_size > 0 and all(rule.pure for rule in self.rules)
+
+    @staticmethod
+    def _fingerprint(df: pd.DataFrame) -> Optional[Tuple]:
+        """Content key for ``df``, or None if its values are unhashable."""
+        try:
+            row_hashes = pd.util.hash_pandas_object(df, index=False).to_numpy()
+        except TypeError:
+            return None
+        return (
+            df.shape,
+            tuple(df.columns),
+            tuple(str(d) for d in df.dtypes),
+            hashlib.blake2b(row_hashes.tobytes(), digest_size=16).digest(),
+        )
 
     def __len__(self) -> int:
         return len(self.rules)
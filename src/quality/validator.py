@@ -5,7 +5,7 @@ DataValidator orchestrates rule evaluation, collects results,
 and produces a ValidationReport.
 """
 
-from typing import List
+from typing import List, Optional
 
 import pandas as pd
 
@@ -31,9 +31,22 @@ class DataValidator:
             report.print_failures()
     """
 
-    def __init__(self, name: str = 'validation'):
+    def __init__(
+        self,
+        name: str = 'validation',
+        cache_size: int = 0,
+        max_workers: Optional[int] = None,
+    ):
+        """
+        Args:
+            name: Name reported on each ValidationReport.
+            cache_size: Number of recent DataFrame results to memoize
+                (0 disables caching; see RuleSet).
+            max_workers: Threads for evaluating rules concurrently
+                (None or 1 runs them serially; see RuleSet).
+        """
         self.name = name
-        self._ruleset = RuleSet(name)
+        self._ruleset = RuleSet(name, cache_size=cache_size, max_workers=max_workers)
 
     def add_rule(self, rule: Rule) -> 'DataValidator':
         """Add a single rule."""
@@ -1,5 +1,6 @@
 """Tests for BaseClient: rate limiter, cache, retries, telemetry."""
 
+import threading
 import time
 from unittest.mock import patch, MagicMock
 
@@ -50,6 +51,28 @@ class TestRateLimiter:
         elapsed = time.monotonic() - start
         assert elapsed < 0.2  # Should be nearly instant
 
+    def test_empty_bucket_queues_reservations(self):
+        """Each waiter should sleep once, until its own token refills."""
+        client = StubClient()
+        client._empty_at_ns = time.monotonic_ns()  # bucket just ran dry
+        with patch.object(client, "_wake") as wake:
+            wake.wait.return_value = False
+            client._wait_for_token()
+            client._wait_for_token()
+        waits = [c.args[0] for c in wake.wait.call_args_list]
+        # 2 tokens/second: first waiter 0.5s, second queued behind it
+        assert waits == [pytest.approx(0.5, abs=0.05), pytest.approx(1.0, abs=0.05)]
+
+    def test_close_interrupts_throttled_caller(self):
+        """close() should end a rate-limit wait instead of letting it sleep."""
+        client = StubClient()
+        client._empty_at_ns = time.monotonic_ns() + 5_000_000_000  # 5s backlog
+        threading.Timer(0.05, client.close).start()
+        start = time.monotonic()
+        with pytest.raises(RuntimeError, match="closed"):
+            client._wait_for_token()
+        assert time.monotonic() - start < 1
+
 
 class TestCache:
     """Response cache tests."""
@@ -69,6 +92,101 @@ class TestCache:
         time.sleep(0.01)
         assert client._cache_get(key) is None
 
+    def test_cache_evicts_least_recently_used(self):
+        """A full cache should drop the entry untouched for longest."""
+        client = StubClient(cache_ttl=60, cache_max_entries=2)
+        a, b, c = (client._cache_key("https://example.com", {"n": n}) for n in range(3))
+        client._cache_set(a, "a")
+        client._cache_set(b, "b")
+        client._cache_get(a)  # a is now most recently used
+        client._cache_set(c, "c")
+        assert client._cache_get(b) is None
+        assert client._cache_get(a) == "a"
+        assert client._cache_get(c) == "c"
+
+    def test_stale_entry_revalidated_with_etag(self):
+        """An expired entry with an ETag should be renewed on 304."""
+        client = StubClient(cache_ttl=0)
+        url = "https://stub.example.com/test"
+        client._cache_set(client._cache_key(url), {"ok": True}, etag='"v1"')
+        time.sleep(0.01)
+
+        mock_resp = MagicMock(status_code=304)
+        with patch.object(client._session, "get", return_value=mock_resp) as mock_get:
+            assert client._get("/test") == {"ok": True}
+        assert mock_get.call_args.kwargs["headers"]["If-None-Match"] == '"v1"'
+
+    @patch("src.extractors.base_client.BaseClient._wait_for_token")
+    def test_304_after_eviction_refetches_in_full(self, mock_token):
+        """A 304 for an entry evicted meanwhile should not use up a retry."""
+        client = StubClient(cache_ttl=0)
+        url = "https://stub.example.com/test"
+        key = client._cache_key(url)
+        client._cache_set(key, {"old": True}, etag='"v1"')
+        time.sleep(0.01)
+
+        responses = iter([
+            MagicMock(status_code=304),
+            MagicMock(status_code=200, content=b'{"ok": true}', headers={}),
+        ])
+
+        def respond(*args, **kwargs):
+            with client._cache_lock:
+                client._cache.pop(key, None)  # evicted while the 304 was in flight
+            return next(responses)
+
+        with patch.object(client._session, "get", side_effect=respond) as mock_get:
+            assert client._get("/test", max_retries=0) == {"ok": True}
+        assert "If-None-Match" not in mock_get.call_args.kwargs["headers"]
+        assert client.api_calls == 2
+
+    @patch("src.extractors.base_client.BaseClient._wait_for_token")
+    def test_unsolicited_304_is_an_error(self, mock_token):
+        """A 304 without conditional headers has no body and should raise."""
+        client = StubClient()
+        with patch.object(client._session, "get", return_value=MagicMock(status_code=304)):
+            with pytest.raises(requests.HTTPError, match="304"):
+                client._get("/test")
+        assert client.api_calls == 1
+
+    def test_concurrent_misses_share_one_request(self):
+        """Simultaneous misses on one key should trigger a single fetch."""
+        client = StubClient()
+
+        def slow_get(*args, **kwargs):
+            time.sleep(0.2)  # hold the request open while the others arrive
+            return MagicMock(status_code=200, content=b'{"ok": true}', headers={})
+
+        with patch.object(client._session, "get", side_effect=slow_get) as mock_get:
+            results = client._map_concurrent(lambda _: client._get("/test"), range(4))
+
+        assert results == [{"ok": True}] * 4
+        assert mock_get.call_count == 1
+        assert client.cache_hits == 3
+
+    def test_follower_stops_waiting_on_hung_leader(self):
+        """A follower should fetch on its own once the wait times out."""
+        client = StubClient()
+        client.REQUEST_TIMEOUT = 0.1
+        leader_in_flight, release = threading.Event(), threading.Event()
+
+        def get(*args, **kwargs):
+            if not leader_in_flight.is_set():
+                leader_in_flight.set()
+                release.wait(2)  # the leader hangs until released
+            return MagicMock(status_code=200, content=b'{"ok": true}', headers={})
+
+        with patch.object(client._session, "get", side_effect=get) as mock_get:
+            leader = threading.Thread(target=client._get, args=("/test",))
+            leader.start()
+            leader_in_flight.wait(2)
+            start = time.monotonic()
+            assert client._get("/test") == {"ok": True}
+            assert time.monotonic() - start < 1
+            release.set()
+            leader.join()
+        assert mock_get.call_count == 2
+
     def test_cache_key_deterministic(self):
         """Same URL + params should produce the same cache key."""
         client = StubClient()
@@ -76,6 +194,15 @@ class TestCache:
         key2 = client._cache_key("https://example.com", {"a": 1, "b": 2})
         assert key1 == key2
 
+    def test_cache_key_accepts_list_params(self):
+        """Repeated query keys (list values) should still make a cache key."""
+        client = StubClient()
+        key = client._cache_key("https://example.com", {"ids": [1, 2]})
+        assert key == client._cache_key("https://example.com", {"ids": [1, 2]})
+        assert key != client._cache_key("https://example.com", {"ids": [2, 1]})
+        client._cache_set(key, {"ok": True})
+        assert client._cache_get(key) == {"ok": True}
+
     def test_cache_key_differs_for_different_params(self):
         """Different params should produce different cache keys."""
         client = StubClient()
@@ -98,13 +225,43 @@ class TestRetries:
         mock_resp_200 = MagicMock()
         mock_resp_200.status_code = 200
         mock_resp_200.json.return_value = {"ok": True}
+        mock_resp_200.content = b'{"ok": true}'
 
         with patch.object(client._session, "get", side_effect=[mock_resp_500, mock_resp_200]):
-            with patch("src.extractors.base_client.time.sleep"):
+            with patch.object(client, "_wake") as wake:
+                wake.wait.return_value = False
                 result = client._get("/test", use_cache=False)
         assert result == {"ok": True}
         assert client.api_calls == 2
 
+    @patch("src.extractors.base_client.BaseClient._wait_for_token")
+    def test_no_sleep_after_final_attempt(self, mock_token):
+        """Exhausted retries should raise without a last backoff sleep."""
+        client = StubClient()
+        mock_resp_500 = MagicMock(status_code=500, headers={})
+
+        with patch.object(client._session, "get", return_value=mock_resp_500):
+            with patch.object(client, "_wake") as wake:
+                wake.wait.return_value = False
+                with pytest.raises(requests.HTTPError):
+                    client._get("/test", max_retries=2, use_cache=False)
+        assert client.api_calls == 3
+        assert wake.wait.call_count == 2
+
+    @patch("src.extractors.base_client.BaseClient._wait_for_token")
+    def test_close_cancels_backoff(self, mock_token):
+        """A closed client should give up instead of sleeping to retry."""
+        client = StubClient()
+        client.close()
+        mock_resp_500 = MagicMock(status_code=500, headers={})
+
+        with patch.object(client._session, "get", return_value=mock_resp_500):
+            start = time.monotonic()
+            with pytest.raises(requests.HTTPError):
+                client._get("/test", use_cache=False)
+        assert time.monotonic() - start < 0.5
+        assert client.api_calls == 1
+
     @patch("src.extractors.base_client.BaseClient._wait_for_token")
     def test_no_retry_on_4xx(self, mock_token):
         """Should not retry on client errors (except 429)."""
@@ -130,14 +287,42 @@ class TestRetries:
         mock_resp_200 = MagicMock()
         mock_resp_200.status_code = 200
         mock_resp_200.json.return_value = {"ok": True}
+        mock_resp_200.content = b'{"ok": true}'
 
         with patch.object(client._session, "get", side_effect=[mock_resp_429, mock_resp_200]):
-            with patch("src.extractors.base_client.time.sleep") as mock_sleep:
+            with patch.object(client, "_wake") as wake:
+                wake.wait.return_value = False
                 result = client._get("/test", use_cache=False)
-        mock_sleep.assert_any_call(2)
+        wake.wait.assert_any_call(2)
         assert result == {"ok": True}
 
 
+class TestConcurrency:
+    """Thread-pool fan-out tests."""
+
+    def test_map_concurrent_preserves_order(self):
+        """Results should come back in input order."""
+        client = StubClient()
+        assert client._map_concurrent(lambda x: x * 2, range(20)) == [x * 2 for x in range(20)]
+
+    def test_map_concurrent_overlaps_calls(self):
+        """Independent calls should run at the same time."""
+        client = StubClient()
+        barrier = threading.Barrier(2, timeout=2)
+        # Both calls must be in flight together to pass the barrier
+        assert client._map_concurrent(lambda x: barrier.wait() is not None, [1, 2]) == [True, True]
+
+    def test_map_concurrent_propagates_errors(self):
+        """The first exception should reach the caller."""
+        client = StubClient()
+
+        def boom(x):
+            raise ValueError(f"bad {x}")
+
+        with pytest.raises(ValueError, match="bad"):
+            client._map_concurrent(boom, [1, 2])
+
+
 class TestTelemetry:
     """Telemetry tracking tests."""
 
@@ -162,16 +347,37 @@ class TestTelemetry:
         assert t["cache_hits"] == 0
         assert t["errors"] == 0
 
+    def test_counters_exact_under_concurrency(self):
+        """Counters bumped from fan-out threads should not lose updates."""
+        client = StubClient()
+        client._map_concurrent(lambda _: [client._count("cache_hits") for _ in range(1000)], range(8))
+        assert client.get_telemetry()["cache_hits"] == 8000
+
+    def test_avg_latency(self):
+        """avg_latency should be the mean of recorded request latencies."""
+        client = StubClient()
+        assert client.get_telemetry()["avg_latency"] == 0.0
+        for seconds in (0.1, 0.2, 0.6):
+            client._record_latency(seconds)
+        assert client.get_telemetry()["avg_latency"] == pytest.approx(0.3)
+
 
 class TestSession:
     """Session and header tests."""
 
     def test_custom_user_agent(self):
-        """Session should have a custom User-Agent header."""
+        """Requests should carry a custom User-Agent header."""
         client = StubClient()
-        ua = client._session.headers["User-Agent"]
+        mock_resp = MagicMock(status_code=200, content=b"{}")
+        with patch.object(client._session, "get", return_value=mock_resp) as mock_get:
+            client._get("/test", use_cache=False)
+        ua = mock_get.call_args.kwargs["headers"]["User-Agent"]
         assert "stub" in ua  # Verify source name in User-Agent
-        assert "stub" in ua
+
+    def test_headers_built_once_per_class(self):
+        """Clients of one source should share a single header dict."""
+        assert StubClient()._headers is StubClient()._headers
+        assert StubClient._headers["User-Agent"].endswith("/stub")
 
     def test_session_reuse(self):
         """Multiple calls should reuse the same session object."""
@@ -179,3 +385,18 @@ class TestSession:
         session1 = client._session
         session2 = client._session
         assert session1 is session2
+
+    def test_clients_of_one_host_share_session(self):
+        """Clients for the same host should share one connection pool."""
+        assert StubClient()._session is StubClient()._session
+
+    def test_explicit_session_overrides_shared(self):
+        """A session passed in should be used instead of the shared one."""
+        session = requests.Session()
+        assert StubClient(session=session)._session is session
+
+    def test_connection_pool_sized_for_concurrency(self):
+        """Keep-alive pool should hold at least one connection per worker."""
+        client = StubClient()
+        adapter = client._session.get_adapter("https://stub.example.com")
+        assert adapter._pool_maxsize >= client.MAX_WORKERS
@@ -1,5 +1,6 @@
 """Tests for USGS, Open-Meteo, and World Bank clients."""
 
+from datetime import date, datetime, timezone
 from unittest.mock import patch
 
 
@@ -37,6 +38,20 @@ class TestUSGSClient:
         assert result.records == 3
         assert mock_get.call_count == 1  # Only 1 page needed (3 < 500)
 
+    @patch.object(USGSClient, "_get")
+    def test_accepts_date_objects(self, mock_get, mock_geojson):
+        """Should serialize date/datetime bounds as YYYY-MM-DD params."""
+        mock_get.return_value = mock_geojson
+        client = USGSClient()
+        client.extract(
+            start_date=datetime(2024, 1, 1, 12, 30, tzinfo=timezone.utc),
+            end_date=date(2024, 12, 31),
+        )
+
+        params = mock_get.call_args.kwargs["params"]
+        assert params["starttime"] == "2024-01-01"
+        assert params["endtime"] == "2024-12-31"
+
     @patch.object(USGSClient, "_get")
     def test_empty_response(self, mock_get):
         """Should handle empty feature sets gracefully."""
@@ -92,6 +107,8 @@ class TestOpenMeteoClient:
         assert result.success
         assert result.records == 6  # 3 days * 2 locations
         assert mock_get.call_count == 2
+        assert result.data["location"].dtype == "category"
+        assert set(result.data["location"].cat.categories) == {"New York", "Los Angeles"}
 
     @patch.object(OpenMeteoClient, "_get")
     def test_missing_daily_data(self, mock_get):
@@ -145,6 +162,24 @@ class TestWorldBankClient:
         assert result.success
         assert mock_get.call_count == 2  # One call per indicator
 
+    @patch.object(WorldBankClient, "_get")
+    def test_remaining_pages_fetched_in_order(self, mock_get):
+        """Pages after the first should all be fetched, kept in page order."""
+        def page(path, params):
+            n = params["page"]
+            return [
+                {"page": n, "pages": 3, "total": 3},
+                [{"countryiso3code": "USA", "date": str(2020 + n), "value": n}],
+            ]
+
+        mock_get.side_effect = page
+        client = WorldBankClient()
+        result = client.extract(countries=["US"], indicators=["NY.GDP.PCAP.CD"])
+
+        assert result.success
+        assert mock_get.call_count == 3
+        assert result.data["year"].tolist() == [2021, 2022, 2023]
+
     @patch.object(WorldBankClient, "_get")
     def test_empty_indicator(self, mock_get):
         """Should handle null data array gracefully."""
@@ -1,10 +1,12 @@
 """Tests for MultiSourceCollector orchestrator."""
 
+import asyncio
 from unittest.mock import MagicMock
 from datetime import datetime
 
 import pandas as pd
 import pytest
+import requests
 
 from src.pipeline.orchestrator import MultiSourceCollector
 from src.extractors.result import ExtractionResult
@@ -22,6 +24,16 @@ class TestRegistration:
         c.register("weather", OpenMeteoClient())
         assert sorted(c.list_sources()) == ["usgs", "weather"]
 
+    def test_shared_session_attached_on_register(self):
+        """A collector session should be used by every registered client."""
+        session = requests.Session()
+        c = MultiSourceCollector(session=session)
+        usgs, weather = USGSClient(), OpenMeteoClient()
+        c.register("usgs", usgs)
+        c.register("weather", weather)
+        assert usgs._session is session
+        assert weather._session is session
+
     def test_empty_collector(self):
         """New collector should have no sources."""
         c = MultiSourceCollector()
@@ -89,6 +101,25 @@ class TestCollect:
         results = c.collect_all()
         assert results == {}
 
+    def test_collect_all_async(self):
+        """Async collection should match collect_all, isolating errors."""
+        c = MultiSourceCollector()
+        good = MagicMock()
+        good.extract.return_value = ExtractionResult(
+            success=True, source="good", records=10
+        )
+        bad = MagicMock()
+        bad.extract.side_effect = RuntimeError("API down")
+        c.register("good", good)
+        c.register("bad", bad)
+
+        results = asyncio.run(c.collect_all_async(good={"min_magnitude": 5.0}))
+
+        assert list(results) == ["good", "bad"]
+        assert results["good"].success
+        assert "API down" in results["bad"].error
+        good.extract.assert_called_once_with(min_magnitude=5.0)
+
 
 class TestTelemetry:
     """Telemetry aggregation tests."""
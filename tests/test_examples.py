@@ -0,0 +1,31 @@
+"""
+Tests for helpers in the example scripts.
+"""
+
+import importlib.util
+from pathlib import Path
+
+EXAMPLES = Path(__file__).parent.parent / "examples"
+
+
+def _load(name):
+    spec = importlib.util.spec_from_file_location(name, EXAMPLES / f"{name}.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class TestTopRegions:
+
+    def test_unmatched_and_null_places_skipped(self):
+        top_regions = _load("collect_earthquakes").top_regions
+        places = [
+            "10 km S of X, Japan", "Nowhere", None,
+            "5 km N of Y, Japan", "Fiji region", "z, Chile",
+        ]
+        assert top_regions(places) == [("Japan", 2), ("Chile", 1)]
+
+    def test_limits_to_n(self):
+        top_regions = _load("collect_earthquakes").top_regions
+        places = ["a, Japan", "b, Japan", "c, Chile", "d, Peru", "e, Peru", "f, Peru"]
+        assert top_regions(places, n=2) == [("Peru", 3), ("Japan", 2)]
@@ -100,6 +100,13 @@ class TestRangeRule:
         assert result.passed is False
         assert result.details['violations'] == 1
 
+    def test_large_nullable_integers_keep_precision(self):
+        for dtype in ('Int64', 'int64[pyarrow]'):
+            df = pd.DataFrame({'n': pd.Series([2**62 + 1, None, 5], dtype=dtype)})
+            result = RangeRule(column='n', max_val=2**62).evaluate(df)
+            assert result.details['violations'] == 1, dtype
+            assert result.details['checked'] == 2
+
     def test_missing_column(self, clean_df):
         rule = RangeRule(column='nonexistent', min_val=0)
         result = rule.evaluate(clean_df)
@@ -130,6 +137,12 @@ class TestPatternRule:
         result = rule.evaluate(financial_df)
         assert result.passed is True
 
+    def test_arrow_and_object_columns_agree(self, messy_df):
+        rule = PatternRule(column='email', pattern=r'^[\w.+-]+@[\w-]+\.[\w.]+$')
+        as_object = messy_df.astype({'email': object})
+        as_arrow = messy_df.astype({'email': 'string[pyarrow]'})
+        assert rule.evaluate(as_arrow).details == rule.evaluate(as_object).details
+
 
 class TestCustomRule:
 
@@ -185,3 +198,36 @@ class TestRuleSet:
         rs = RuleSet('chain')
         rs.add(CompletenessRule(columns=['id'])).add(RangeRule(column='score', min_val=0))
         assert len(rs) == 2
+
+    def test_cache_reuses_results_for_unchanged_frame(self, clean_df):
+        calls = []
+        rs = RuleSet('cached', cache_size=4)
+        rs.add(CustomRule(func=lambda df: (calls.append(1) or True, {}), pure=True))
+        rs.evaluate(clean_df)
+        rs.evaluate(clean_df.copy())
+        assert len(calls) == 1
+
+        changed = clean_df.assign(score=clean_df['score'] + 1)
+        rs.evaluate(changed)
+        assert len(calls) == 2
+
+    def test_cache_bypassed_for_impure_rules(self, clean_df):
+        calls = []
+        rs = RuleSet('uncached', cache_size=4)
+        rs.add(CustomRule(func=lambda df: (calls.append(1) or True, {})))
+        rs.evaluate(clean_df)
+        rs.evaluate(clean_df)
+        assert len(calls) == 2
+
+    def test_parallel_evaluation_keeps_rule_order(self, messy_df):
+        rules = [
+            CompletenessRule(columns=['name']),
+            UniquenessRule(columns=['id']),
+            RangeRule(column='score', min_val=0, max_val=100),
+            CompletenessRule(columns=['id']),
+        ]
+        serial, parallel = RuleSet('serial'), RuleSet('parallel', max_workers=4)
+        for rule in rules:
+            serial.add(rule)
+            parallel.add(rule)
+        assert parallel.evaluate(messy_df) == serial.evaluate(messy_df)
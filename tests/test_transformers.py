@@ -0,0 +1,89 @@
+"""
+Tests for the star schema builder and shared transformer helpers.
+"""
+
+import pandas as pd
+
+from src.transformers.base_transformer import BaseTransformer, TransformationResult
+from src.transformers.star_schema import StarSchemaBuilder
+
+
+class StubTransformer(BaseTransformer):
+    """Minimal concrete transformer for testing shared helpers."""
+
+    def transform(self, raw_data):
+        return TransformationResult(success=True)
+
+
+class TestSurrogateKeysBulk:
+
+    def _keys(self, df, cols):
+        return StubTransformer().generate_surrogate_keys_bulk(df, cols)
+
+    def test_keys_are_uint64(self):
+        df = pd.DataFrame({'series_id': ['GDP', 'CPI'], 'year': [2020, 2021]})
+        assert self._keys(df, ['series_id', 'year']).dtype == 'uint64'
+
+    def test_equal_tuples_get_equal_keys(self):
+        df = pd.DataFrame({'series_id': ['GDP', 'CPI', 'GDP'], 'year': [2020, 2020, 2020]})
+        keys = self._keys(df, ['series_id', 'year'])
+        assert keys.iloc[0] == keys.iloc[2]
+
+    def test_distinct_tuples_get_distinct_keys(self):
+        df = pd.DataFrame({
+            'series_id': ['GDP', 'GDP', 'CPI', 'CPI'],
+            'year': [2020, 2021, 2020, 2021],
+        })
+        assert self._keys(df, ['series_id', 'year']).is_unique
+
+    def test_keys_stable_across_calls(self):
+        df = pd.DataFrame({'series_id': ['GDP', 'CPI'], 'year': [2020, 2021]})
+        first = self._keys(df, ['series_id', 'year'])
+        # Same values in a fresh frame, another row order and index
+        again = self._keys(df.iloc[::-1].reset_index(drop=True), ['series_id', 'year'])
+        assert first.tolist() == again.iloc[::-1].tolist()
+
+
+class TestReferentialIntegrity:
+
+    def _builder(self, tmp_path):
+        b = StarSchemaBuilder(output_dir=str(tmp_path))
+        b.add_dimension('dim_a', natural_keys=['a_key'], columns=['a_key', 'tags'])
+        b.add_dimension('dim_b', natural_keys=['b_key'], columns=['b_key', 'meta'])
+        b.add_fact('fact', measures=['value'], dimension_keys=['a_key', 'b_key'])
+        return b
+
+    def test_orphan_keys_reported(self, tmp_path):
+        b = self._builder(tmp_path)
+        result = b.build({
+            'dim_a': pd.DataFrame({'a_key': [1, 2], 'tags': ['x', 'y']}),
+            'dim_b': pd.DataFrame({'b_key': [10, 20], 'meta': ['p', 'q']}),
+            'fact': pd.DataFrame({'a_key': [1, 3], 'b_key': [10, 30], 'value': [1.0, 2.0]}),
+        })
+        assert result.success
+        assert b.validate_referential_integrity() == [
+            'fact.a_key: 1 orphan keys',
+            'fact.b_key: 1 orphan keys',
+        ]
+
+    def test_unhashable_attribute_columns_ignored(self, tmp_path):
+        b = self._builder(tmp_path)
+        result = b.build({
+            'dim_a': pd.DataFrame({'a_key': [1, 2], 'tags': [['x'], ['y', 'z']]}),
+            'dim_b': pd.DataFrame({'b_key': [10, 20], 'meta': [{'k': 1}, {'k': 2}]}),
+            'fact': pd.DataFrame({'a_key': [1, 3], 'b_key': [10, 30], 'value': [1.0, 2.0]}),
+        })
+        assert result.success
+        assert b.validate_referential_integrity() == [
+            'fact.a_key: 1 orphan keys',
+            'fact.b_key: 1 orphan keys',
+        ]
+
+    def test_clean_schema_has_no_violations(self, tmp_path):
+        b = self._builder(tmp_path)
+        b.build({
+            'dim_a': pd.DataFrame({'a_key': [1, 2], 'tags': ['x', 'y']}),
+            'dim_b': pd.DataFrame({'b_key': [10, 20], 'meta': ['p', 'q']}),
+            'fact': pd.DataFrame({'a_key': [1, 2], 'b_key': [20, 10], 'value': [1.0, 2.0]}),
+        })
+        assert b.validate_referential_integrity() == []